@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:26
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_alter_task_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='due_date',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='importance',
+            field=models.IntegerField(db_index=True, help_text='Importance rating from 1-10', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(10)]),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['-importance', 'due_date'], name='task_pri_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_alter_task_due_date_alter_task_importance_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='dependencies',
+            field=models.JSONField(blank=True, default=list, help_text='List of task IDs that this task depends on'),
+        ),
+    ]
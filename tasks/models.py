@@ -7,25 +7,30 @@ class Task(models.Model):
     Task model representing a single task with all required properties.
     """
     title = models.CharField(max_length=200)
-    due_date = models.DateField(null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True, db_index=True)
     estimated_hours = models.FloatField(
         validators=[MinValueValidator(0.1)],
         help_text="Estimated hours to complete the task"
     )
     importance = models.IntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(10)],
+        db_index=True,
         help_text="Importance rating from 1-10"
     )
-    dependencies = models.TextField(
-        default='[]',
+    dependencies = models.JSONField(
+        default=list,
         blank=True,
-        help_text="JSON list of task IDs that this task depends on"
+        help_text="List of task IDs that this task depends on"
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Covers the common "most important upcoming tasks" queries
+            models.Index(fields=['-importance', 'due_date'], name='task_pri_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -2,7 +2,30 @@
 Serializers for task validation and data handling.
 """
 from typing import Dict, List, Any, Tuple
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """
+    Cached wrapper around date.fromisoformat. Batches routinely repeat
+    the same handful of due dates (sprint boundaries, end of month), so
+    the C-level parse only runs once per distinct string.
+    """
+    return date.fromisoformat(value)
+
+
+def _coerce_dep(dep: Any) -> Any:
+    """
+    Normalize a dependency reference: ints pass through untouched (the
+    common case), digit strings become ints, anything else is kept as-is.
+    """
+    if isinstance(dep, int):
+        return dep
+    if isinstance(dep, str) and dep.isdigit():
+        return int(dep)
+    return dep
 
 
 def validate_task(task: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
@@ -22,7 +45,7 @@ def validate_task(task: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
     if due_date:
         if isinstance(due_date, str):
             try:
-                datetime.strptime(due_date, '%Y-%m-%d')
+                _parse_date(due_date)
             except ValueError:
                 return False, f"Invalid date format for 'due_date': {due_date}. Use YYYY-MM-DD", {}
     
@@ -56,12 +79,15 @@ def validate_task(task: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
         return False, "dependencies must be a list", {}
     
     # Clean task
+    title = task['title']
+    if not isinstance(title, str):
+        title = str(title)
     cleaned_task = {
-        'title': str(task['title']).strip(),
+        'title': title.strip(),
         'due_date': due_date,
         'estimated_hours': estimated_hours,
         'importance': importance,
-        'dependencies': [int(d) if isinstance(d, (int, str)) and str(d).isdigit() else d for d in dependencies],
+        'dependencies': [_coerce_dep(d) for d in dependencies],
         'id': task.get('id', task.get('title'))  # Use title as fallback ID
     }
     
@@ -79,12 +105,14 @@ def validate_tasks(tasks: List[Dict[str, Any]]) -> Tuple[bool, str, List[Dict[st
     if len(tasks) == 0:
         return False, "Tasks list cannot be empty", []
     
-    cleaned_tasks = []
+    # Preallocate the output list - avoids repeated list-grow
+    # reallocations on large batches
+    cleaned_tasks = [None] * len(tasks)
     for idx, task in enumerate(tasks):
         is_valid, error_msg, cleaned_task = validate_task(task)
         if not is_valid:
             return False, f"Task {idx + 1}: {error_msg}", []
-        cleaned_tasks.append(cleaned_task)
-    
+        cleaned_tasks[idx] = cleaned_task
+
     return True, "", cleaned_tasks
 
@@ -1,6 +1,8 @@
 """
 Unit tests for the task scoring algorithm.
 """
+import json
+
 from django.test import TestCase
 from datetime import date, timedelta
 from .scoring import (
@@ -294,3 +296,153 @@ class CircularDependencyTests(TestCase):
         
         cycles = detect_circular_dependencies(tasks)
         self.assertGreater(len(cycles), 0, "Should detect complex cycle")
+
+
+class VectorizedScoringTests(TestCase):
+    """Test that the vectorized batch path matches the scalar scorers."""
+
+    def test_batch_matches_scalar_scores(self):
+        """Large batches (vectorized path) should produce the same scores
+        as calculate_priority_score does for each task individually."""
+        today = date.today()
+        tasks = []
+        for i in range(50):
+            tasks.append({
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=i - 10)).strftime('%Y-%m-%d') if i % 4 else None,
+                'estimated_hours': (i % 20) + 0.5,
+                'importance': (i % 10) + 1,
+                'dependencies': [i - 1] if i % 5 == 0 and i > 0 else []
+            })
+
+        result = analyze_and_sort_tasks(tasks, strategy='smart_balance')
+        self.assertEqual(len(result), 50)
+
+        by_id = {t['id']: t for t in result}
+        for idx, task in enumerate(tasks):
+            expected = calculate_priority_score(task, tasks, idx, strategy='smart_balance')
+            got = by_id[task['id']]
+            self.assertAlmostEqual(got['priority_score'], expected['score'], delta=0.05)
+            for component in ('urgency', 'importance', 'effort', 'dependencies'):
+                self.assertAlmostEqual(
+                    got['score_breakdown'][component],
+                    expected['breakdown'][component],
+                    delta=0.05
+                )
+
+    def test_batch_handles_dates_beyond_one_year(self):
+        """Due dates more than a year out (or overdue) must not break the
+        vectorized urgency lookup; they saturate at the table tails."""
+        today = date.today()
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'estimated_hours': 2, 'importance': 5}
+            for i in range(40)
+        ]
+        tasks[0]['due_date'] = (today + timedelta(days=400)).strftime('%Y-%m-%d')
+        tasks[1]['due_date'] = (today - timedelta(days=400)).strftime('%Y-%m-%d')
+
+        result = analyze_and_sort_tasks(tasks, strategy='smart_balance')
+        self.assertEqual(len(result), 40)
+
+        by_id = {t['id']: t for t in result}
+        self.assertEqual(by_id[0]['score_breakdown']['urgency'], 5.0)
+        self.assertEqual(by_id[1]['score_breakdown']['urgency'], 100.0)
+
+    def test_batch_sorted_descending(self):
+        """Vectorized results should still come back sorted by score."""
+        tasks = [
+            {'title': f'Task {i}', 'estimated_hours': i + 1, 'importance': (i % 10) + 1}
+            for i in range(40)
+        ]
+        result = analyze_and_sort_tasks(tasks)
+        scores = [t['priority_score'] for t in result]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+
+class AnalyzeViewTests(TestCase):
+    """Test the /api/tasks/analyze/ endpoint."""
+
+    def _post(self, payload):
+        return self.client.post(
+            '/api/tasks/analyze/',
+            data=json.dumps(payload),
+            content_type='application/json'
+        )
+
+    def test_analyze_returns_sorted_tasks(self):
+        """A valid payload should return scored, sorted tasks."""
+        payload = {
+            'tasks': [
+                {'title': 'Low', 'estimated_hours': 10, 'importance': 2, 'dependencies': []},
+                {'title': 'High', 'estimated_hours': 1, 'importance': 9, 'dependencies': []},
+            ]
+        }
+        response = self._post(payload)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['total_tasks'], 2)
+        self.assertEqual(data['tasks'][0]['title'], 'High')
+
+    def test_analyze_large_batch(self):
+        """A batch past the vectorization threshold should come back
+        scored and sorted through the view's worker-thread path."""
+        payload = {
+            'tasks': [
+                {'title': f'Task {i}', 'estimated_hours': (i % 20) + 1,
+                 'importance': (i % 10) + 1}
+                for i in range(40)
+            ]
+        }
+        response = self._post(payload)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['total_tasks'], 40)
+        scores = [t['priority_score'] for t in data['tasks']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_invalid_strategy_rejected(self):
+        """Unknown strategies should return a 400."""
+        payload = {
+            'tasks': [{'title': 'Task', 'importance': 5}],
+            'strategy': 'nonsense'
+        }
+        response = self._post(payload)
+        self.assertEqual(response.status_code, 400)
+
+    def test_repeat_payload_served_from_cache(self):
+        """Identical payloads should produce identical cached responses."""
+        payload = {
+            'tasks': [{'title': 'Task', 'estimated_hours': 2, 'importance': 7}]
+        }
+        first = self._post(payload)
+        second = self._post(payload)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+
+
+class DependencyOrderTests(TestCase):
+    """Test dependency-respecting ordering of analyzed tasks."""
+
+    def test_prerequisite_comes_first(self):
+        """A blocked task should never be ordered before its prerequisite."""
+        tasks = [
+            {'id': 1, 'title': 'Ship feature', 'importance': 10,
+             'estimated_hours': 1, 'dependencies': [2]},
+            {'id': 2, 'title': 'Write spec', 'importance': 2,
+             'estimated_hours': 10, 'dependencies': []},
+        ]
+        result = analyze_and_sort_tasks(tasks)
+        titles = [t['title'] for t in result]
+        self.assertLess(titles.index('Write spec'), titles.index('Ship feature'))
+
+    def test_no_dependencies_keeps_score_order(self):
+        """Without dependencies, pure score order is preserved."""
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'importance': (i % 10) + 1,
+             'estimated_hours': 2}
+            for i in range(6)
+        ]
+        result = analyze_and_sort_tasks(tasks)
+        scores = [t['priority_score'] for t in result]
+        self.assertEqual(scores, sorted(scores, reverse=True))